@@ -1,224 +1,418 @@
 import argparse
-import csv
+import functools
 import logging
+import mmap
+import os
 import re
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import duckdb
-import sqlparse
 
+# Precompiled patterns used while converting PostgreSQL schema files
+_RE_CREATE_TABLE = re.compile(r"CREATE\s+TABLE\s+(\w+\.\w+)", re.IGNORECASE)
+_RE_LEADING_COMMENTS = re.compile(r"(?:--[^\n]*|/\*.*?\*/|\s+)*", re.DOTALL)
+_RE_SERIAL = re.compile(r"(\w+)\s+serial")
+# Quoted strings and comments are matched whole so only top-level ; split statements
+_RE_STATEMENT_BREAK = re.compile(
+    r"'[^']*(?:'|\Z)|\"[^\"]*(?:\"|\Z)|--[^\n]*|/\*.*?(?:\*/|\Z)|;", re.DOTALL
+)
+_RE_COPY_START = re.compile(rb"^COPY[^\n]*\n", re.MULTILINE)
+_RE_COPY_END = re.compile(rb"^[ \t\r]*\\\.[ \t\r]*$", re.MULTILINE)
+
+# Bytes of COPY data inserted per statement, about 40k taxa rows
+_COPY_BATCH_BYTES = 4 * 1024 * 1024
+
+# Single-pass PostgreSQL to DuckDB rewrite: one named group per conversion, so the
+# schema is scanned once. Lines starting with --- are folded into the whitespace
+# runs (the input is prefixed with a newline so the first line can match too).
+_GAP = r"(?:\n[ \t]*---[^\n]*|\s)"
+# The leading lookahead lists the characters any branch can start with, so the
+# scanner skips every other position without trying each alternative.
+_RE_POSTGRES = re.compile(
+    r"(?=[\s;aAfFmMoOT])(?:"
+    r"(?P<ondel>(?i:\s*ON\s+DELETE\s+(?:SET\s+NULL|CASCADE|SET\s+DEFAULT)))"
+    r"|(?P<follows>(?i:\bfollows\s+int4\s+REFERENCES\s+antismash\.as_domains\b))"
+    r"|(?P<asdom>(?i:\bas_domain_id\s+int4\s+NOT\s+NULL\s+REFERENCES\s+antismash\.as_domains\b))"
+    r"|(?P<textarr>TEXT\[\])"
+    r"|(?P<mat>(?i:\bMATERIALIZED\b))"
+    rf"|(?P<semi>;{_GAP}*)"
+    rf"|(?P<ws>{_GAP}+)"
+    r")"
+)
+_POSTGRES_TO_DUCKDB = {
+    "ondel": "",  # Remove unsupported FOREIGN KEY actions
+    "follows": "follows int4",  # as_domains.sql: remove self reference
+    "asdom": "as_domain_id int4 NOT NULL",  # remove many to many reference
+    "textarr": "TEXT",  # DuckDB doesn't support array types directly
+    "mat": "",  # DuckDB doesn't support materialized views
+    "semi": ";\n",  # Ensure semicolons are followed by a newline
+    "ws": " ",  # Combine multiple spaces and tabs into one space
+}
+
+
+def _dispatch(match):
+    """
+    Return the DuckDB replacement for whichever conversion matched.
+    """
+    return _POSTGRES_TO_DUCKDB[match.lastgroup]
+
+
+# SQL keywords upper-cased in the converted statements
+_SQL_KEYWORDS = [
+    "ADD",
+    "ALTER",
+    "AND",
+    "AS",
+    "CHECK",
+    "COMMENT",
+    "CONSTRAINT",
+    "CREATE",
+    "CURRENT_TIMESTAMP",
+    "DEFAULT",
+    "DELETE",
+    "EXISTS",
+    "FOREIGN",
+    "FROM",
+    "IF",
+    "INDEX",
+    "INSERT",
+    "INTO",
+    "IS",
+    "KEY",
+    "NOT",
+    "NULL",
+    "ON",
+    "OR",
+    "PRIMARY",
+    "REFERENCES",
+    "SELECT",
+    "SEQUENCE",
+    "START",
+    "TABLE",
+    "UNIQUE",
+    "USING",
+    "VALUES",
+    "VIEW",
+    "WHERE",
+]
+_RE_SQL_KEYWORD = re.compile(
+    r"'(?:[^']|'')*'|" r'"(?:[^"]|"")*"|\b(?:' + "|".join(_SQL_KEYWORDS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def _split_statements(sql):
+    """
+    Split an SQL script into statements at semicolons outside quoted strings and
+    comments.
 
-def convert_serial_to_sequence(sql, schema="antismash"):
+    Args:
+        sql (str): The SQL script to split.
+
+    Yields:
+        str: Each statement, including its terminating semicolon.
     """
-    Convert SERIAL columns to SEQUENCE in SQL statements.
+    start = 0
+    for match in _RE_STATEMENT_BREAK.finditer(sql):
+        if match.group() == ";":
+            end = match.end()
+            yield sql[start:end]
+            start = end
+    if start < len(sql):
+        yield sql[start:]
+
 
-    This function processes a given SQL string, identifying CREATE TABLE statements
-    and converting any SERIAL column definitions within those statements to use
-    SEQUENCEs instead. This is particularly useful for adapting SQL scripts for
-    databases that do not support the SERIAL keyword.
+def _replace_serial(table_name, column_name, schema):
+    """
+    Build the SEQUENCE declaration and column definition replacing a SERIAL column.
 
     Args:
-        sql (str): The SQL script containing one or more SQL statements.
+        table_name (str): The table name, with the schema separator replaced by "_".
+        column_name (str): The name of the SERIAL column.
+        schema (str): The schema the SEQUENCE is created in.
 
     Returns:
-        str: The modified SQL script with SERIAL columns converted to SEQUENCEs.
+        tuple of str: The SEQUENCE declaration and the new column definition.
+    """
+    sequence_name = f"{table_name}_{column_name}_seq"
+    logging.debug(f"Replacing serial: {sequence_name}")
+    sequence_declaration = f"CREATE SEQUENCE {schema}.{sequence_name} START 1;"
+    column_declaration = (
+        f"{column_name} INTEGER DEFAULT nextval('{schema}.{sequence_name}')"
+    )
+    return sequence_declaration, column_declaration
 
-    The function identifies each CREATE TABLE statement, extracts the table name,
-    and searches for SERIAL column definitions. For each SERIAL column found,
-    it generates a SEQUENCE and modifies the column definition to use the SEQUENCE
-    for its default value. The modified CREATE TABLE statement, along with any
-    newly created SEQUENCE declarations, is then included in the returned SQL script.
+
+@functools.lru_cache(maxsize=256)
+def convert_postgres_to_duckdb(sql, schema="antismash"):
     """
+    Converts PostgreSQL SQL commands to be compatible with DuckDB.
 
-    # Function implementation remains unchanged
-    def replace_serial(table_name, column_name):
-        sequence_name = f"{table_name}_{column_name}_seq"
-        logging.debug(f"Replacing serial: {sequence_name}")
-        sequence_declaration = f"CREATE SEQUENCE {schema}.{sequence_name} START 1;"
-        column_declaration = (
-            f"{column_name} INTEGER DEFAULT nextval('{schema}.{sequence_name}')"
-        )
-        return sequence_declaration, column_declaration
-
-    # Split SQL into individual statements
-    statements = [
-        str(statement).strip()
-        for statement in sqlparse.parse(sql)
-        if str(statement).strip()
-    ]
-    processed_statements = []
+    The syntax conversions are applied in a single pass over the SQL, which is then
+    split into statements. Any SERIAL column definitions of CREATE TABLE statements
+    are converted to use SEQUENCEs in the same traversal, with the new SEQUENCE
+    declarations placed before their CREATE TABLE statement.
 
-    for statement in statements:
-        # Check if the statement is a CREATE TABLE statement
-        if "CREATE TABLE" in statement:
-            # Extract the table name
-            table_name_match = re.search(r"CREATE TABLE (\w+\.\w+)", statement)
-            if table_name_match:
-                table_name = table_name_match.group(1).replace(".", "_")
-
-                # Find all serial columns
-                pattern = r"(\w+)\s+serial"
-                matches = re.findall(pattern, statement)
-
-                sequence_declarations = []
-                for column_name in matches:
-                    sequence_declaration, column_declaration = replace_serial(
-                        table_name, column_name
-                    )
-                    sequence_declarations.append(sequence_declaration)
-                    statement = re.sub(
-                        rf"{column_name}\s+serial",
-                        column_declaration,
-                        statement,
-                        count=1,
-                    )
+    The conversion is pure, so results are cached per input SQL string.
 
-                # Add sequence declarations before the CREATE TABLE statement
-                processed_statement = (
-                    "\n".join(sequence_declarations) + "\n" + statement
-                    if sequence_declarations
-                    else statement
-                )
-                processed_statements.append(processed_statement)
-            else:
-                # If no table name is found, append the original statement
-                processed_statements.append(statement)
-        else:
+    Args:
+    - sql (str): The PostgreSQL SQL command.
+    - schema (str): The schema the SEQUENCEs are created in.
+
+    Returns:
+    - tuple of str: The converted SQL statements for DuckDB.
+    """
+    # Strip --- comments, normalize whitespace and semicolons, and apply the
+    # PostgreSQL to DuckDB syntax conversions in a single pass
+    sql = _RE_POSTGRES.sub(_dispatch, "\n" + sql)
+
+    processed_statements = []
+
+    for statement in _split_statements(sql):
+        statement = statement.strip()
+        if not statement or statement == ";":
+            continue
+
+        # Extract the table name of CREATE TABLE statements; the statements are
+        # normalized and stripped, so they start with the keywords, possibly after
+        # comments
+        start = 0
+        if statement[0] in "-/":
+            start = _RE_LEADING_COMMENTS.match(statement).end()
+        end = start + len("CREATE TABLE")
+        table_name_match = None
+        if statement[start:end].upper() == "CREATE TABLE":
+            table_name_match = _RE_CREATE_TABLE.match(statement, start)
+        if table_name_match is None:
             # For non-CREATE TABLE statements, append them as they are
             processed_statements.append(statement)
+            continue
+        table_name = table_name_match.group(1).replace(".", "_")
+
+        # Replace all serial columns in a single pass, collecting their sequence
+        # declarations in order
+        sequence_declarations = []
+
+        def replace_column(match):
+            sequence_declaration, column_declaration = _replace_serial(
+                table_name, match.group(1), schema
+            )
+            sequence_declarations.append(sequence_declaration)
+            return column_declaration
 
-    # Reassemble the processed statements back into a single SQL string
-    modified_sql = ";".join(processed_statements)
-    return modified_sql
+        statement = _RE_SERIAL.sub(replace_column, statement)
 
+        # Add sequence declarations before the CREATE TABLE statement
+        processed_statements.extend(sequence_declarations)
+        processed_statements.append(statement)
 
-def convert_postgres_to_duckdb(sql):
+    return tuple(processed_statements)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_sql(sql):
     """
-    Converts PostgreSQL SQL commands to be compatible with DuckDB.
+    Upper-case the SQL keywords of a statement, leaving quoted strings and
+    identifiers untouched.
+    """
+    return _RE_SQL_KEYWORD.sub(
+        lambda m: m.group() if m.group()[0] in "'\"" else m.group().upper(), sql
+    )
+
+
+def _write_sql_file(path, statements):
+    """
+    Write SQL statements to a record file, one per line.
 
     Args:
-    - sql (str): The PostgreSQL SQL command.
+        path (Path): The SQL file to write.
+        statements (iterable of str): The statements to record.
+    """
+    with open(path, "w") as f:
+        f.writelines(statement.rstrip(";") + ";\n" for statement in statements)
+
+
+def _find_copy_data(buffer):
+    """
+    Locate the data section of a memory-mapped PostgreSQL COPY dump.
+
+    Args:
+        buffer (mmap.mmap): The mapped SQL file containing the COPY command.
 
     Returns:
-    - str: The converted SQL command for DuckDB.
+        tuple of int: The start and end offsets of the data lines between the COPY
+        command and the terminating "\\.", or None without a COPY command.
     """
-    # Define conversions for PostgreSQL to DuckDB syntax
-    conversions = {
-        "TEXT[]": "TEXT",  # DuckDB doesn't support array types directly
-        "MATERIALIZED": "",  # DuckDB doesn't support materialized views
-        "CURRENT_TIMESTAMP": "CURRENT_TIMESTAMP",  # remains the same
-        # Add more conversions as needed
-    }
+    copy_match = _RE_COPY_START.search(buffer)
+    if copy_match is None:
+        return None
+    start = copy_match.end()
+    end_match = _RE_COPY_END.search(buffer, start)
+    end = len(buffer) if end_match is None else end_match.start()
+    return start, end
 
-    # Remove lines starting with ---
-    sql = re.sub(r"(?m)^\s*---.*\n?", "", sql)
-
-    # Combine multiple spaces into one, replace tabs with a single space, and ensure semicolons are followed by a newline
-    sql = re.sub(
-        r"\s+", " ", sql
-    )  # Replace any whitespace character (space, tab, newline) with a single space
-    sql = re.sub(
-        r";\s*", ";\n", sql
-    )  # Ensure semicolons are followed by exactly one newline
-
-    # Convert CREATE TABLE statements with serial types to use sequences
-    sql = convert_serial_to_sequence(sql)
-
-    # Remove or modify unsupported FOREIGN KEY actions
-    sql = re.sub(r"ON DELETE SET NULL", "", sql)
-    sql = re.sub(r"ON DELETE CASCADE", "", sql)
-    sql = re.sub(r"ON DELETE SET DEFAULT", "", sql)
-
-    # Custom modifications for specific tables: as_domains.sql
-    sql = re.sub(
-        r"follows int4 REFERENCES antismash.as_domains", "follows int4", sql
-    )  # remove self reference
-    sql = re.sub(
-        r"as_domain_id int4 NOT NULL REFERENCES antismash.as_domains",
-        "as_domain_id int4 NOT NULL",
-        sql,
-    )  # remove many to many reference
-
-    for pg_syntax, duckdb_syntax in conversions.items():
-        sql = sql.replace(pg_syntax, duckdb_syntax)
-
-    return sql
-
-
-def sql_to_csv(
-    input_sql_file,
-    output_csv_file,
-    headers=[
-        "tax_id",
-        "ncbi_taxid",
-        "superkingdom",
-        "kingdom",
-        "phylum",
-        "class",
-        "taxonomic_order",
-        "family",
-        "genus",
-        "species",
-        "strain",
-        "name",
-    ],
-):
+
+def _iter_copy_data(input_sql_file, batch_size=_COPY_BATCH_BYTES):
     """
-    Convert SQL file data to a CSV file.
+    Read the data section of a PostgreSQL COPY dump in batches of whole lines.
 
-    This function reads an SQL file, specifically looking for a section of data
-    that was exported using the COPY command (common in PostgreSQL dumps), and
-    converts this data into a CSV format. The function allows for specifying
-    custom headers for the CSV file, which are written as the first row of the
-    output CSV file.
+    The dump is memory-mapped and only one batch is decoded at a time, so memory
+    use does not grow with the size of the dump.
 
     Args:
-        input_sql_file (str): Path to the input SQL file containing the data to be converted.
-        output_csv_file (str): Path where the output CSV file will be saved.
-        headers (list of str): A list of strings representing the column headers for the CSV file.
-            Defaults to a predefined list of headers related to taxonomic information.
-
-    The function first identifies the start and end of the data section within the SQL file,
-    which is delimited by the COPY command and a terminating "\\.". It then reads the data
-    lines, processes them to replace any null values represented by '\\N' with an empty string,
-    and writes the processed data to the specified CSV file, including the provided headers.
+        input_sql_file (str or Path): Path to the SQL file containing the COPY command.
+        batch_size (int): The approximate number of bytes per batch.
+
+    Yields:
+        str: Tab-delimited data lines, without the trailing newline.
+    """
+    with open(input_sql_file, "rb") as sql_file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(sql_file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(sql_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            span = _find_copy_data(buffer)
+            if span is None:
+                return
+            start, end = span
+            while start < end:
+                # Cut each batch after a line break so no row is split
+                stop = buffer.find(b"\n", min(start + batch_size, end), end)
+                stop = end if stop == -1 else stop + 1
+                batch = buffer[start:stop].decode("utf-8")
+                start = stop
+                # Translate CRLF and CR line endings like a text-mode read would
+                if "\r" in batch:
+                    batch = batch.replace("\r\n", "\n").replace("\r", "\n")
+                batch = batch.rstrip("\n")
+                if batch:
+                    yield batch
+
+
+def _next_copy_id(input_sql_file):
+    """
+    Return the ID following the one in the first column of the last data line.
+
+    Only the last line of the memory-mapped data section is read.
+    """
+    with open(input_sql_file, "rb") as sql_file:
+        if os.fstat(sql_file.fileno()).st_size == 0:
+            return 1
+        with mmap.mmap(sql_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            span = _find_copy_data(buffer)
+            if span is None:
+                return 1
+            start, end = span
+            # Skip the line breaks ending the data section
+            while end > start and buffer[end - 1] in b"\r\n":
+                end -= 1
+            if end == start:
+                return 1
+            line_start = max(buffer.rfind(b"\n", start, end) + 1, start)
+            return int(buffer[line_start:end].split(b"\t", 1)[0]) + 1
+
+
+def _load_copy_data(conn, table, columns, input_sql_file):
+    """
+    Insert PostgreSQL COPY data into a DuckDB table without an intermediate file.
+
+    Each batch of data lines is bound as a single parameter and split into rows
+    and columns by DuckDB itself, so no per-row work happens in Python and the
+    column types are taken from the target table. Null values represented by '\\N'
+    are inserted as NULL.
+
+    Args:
+        conn (duckdb.DuckDBPyConnection): The DuckDB connection.
+        table (str): The qualified name of the target table.
+        columns (list of str): The target columns, in the order of the COPY data.
+        input_sql_file (str or Path): Path to the SQL file containing the COPY command.
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    fields = ", ".join(
+        f"NULLIF(fields[{i}], '\\N')" for i in range(1, len(columns) + 1)
+    )
+    insert = (
+        f"INSERT INTO {table} ({', '.join(columns)}) SELECT {fields} FROM "
+        "(SELECT string_split(unnest(string_split(?, chr(10))), chr(9)) AS fields)"
+    )
+    rows = 0
+    for batch in _iter_copy_data(input_sql_file):
+        conn.execute(insert, [batch])
+        rows += batch.count("\n") + 1
+    return rows
+
+
+# List of tables and views to process
+TABLES = (
+    "sampling_sites",
+    "bgc_types",
+    "substrates",
+    "taxa",
+    "profiles",
+    "as_domain_profiles",
+    "pfams",
+    "gene_ontologies",
+    "resfams",
+    "tigrfams",
+    "bgc_rules",
+    "samples",
+    "isolates",
+    "genomes",
+    "dna_sequences",
+    "regions",
+    "candidates",
+    "protoclusters",
+    "functional_classes",
+    "smcogs",
+    "cdss",
+    "genes",
+    "ripps",
+    "t2pks",
+    "monomers",
+    "modules",
+    "as_domains",
+    "clusterblast_algorithms",
+    "clusterblast_hits",
+    "tta_codons",
+    "pfam_domains",
+    "pfam_go_entries",
+    "filenames",
+    "resfam_domains",
+    "tfbs",
+    "comparippson",
+    "tigrfam_domains",
+    "cluster_compare_hits",
+    "rel_candidates_protoclusters",
+    "rel_candidates_types",
+    "rel_candidates_modules",
+    "rel_cds_candidates",
+    "rel_cds_protoclusters",
+    "rel_regions_types",
+    "rel_as_domains_substrates",
+    "smcog_hits",
+    "profile_hits",
+    "rel_modules_monomers",
+    "view_sequence_gc_content",
+    "view_sequence_lengths",
+    "preload_taxa",
+    "preload_monomers",
+)
+
+# Customized DuckDB SQL for the GC content view
+_VIEW_SEQUENCE_GC_CONTENT = """
+    CREATE VIEW antismash.sequence_gc_content AS
+    SELECT
+        accession,
+        ROUND(100.0 * (
+            length(dna) - length(replace(replace(dna, 'G', ''), 'C', ''))
+        ) / length(dna), 2) AS gc_content
+    FROM
+        antismash.dna_sequences;
     """
-    logging.info(f"Converting SQL file {input_sql_file} to CSV file...")
-    # Open the SQL file and read its contents
-    with open(input_sql_file, "r") as sql_file:
-        lines = sql_file.readlines()
-
-    # Find the start and end of the data section
-    start_index = 0
-    end_index = 0
-    for i, line in enumerate(lines):
-        if line.startswith("COPY"):
-            start_index = i + 1
-        elif line.strip() == "\\.":
-            end_index = i
-            break
-
-    # Extract the data lines
-    data_lines = lines[start_index:end_index]
-
-    # Open the CSV file for writing
-    with open(output_csv_file, "w", newline="") as csv_file:
-        writer = csv.writer(
-            csv_file, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
-        )
-
-        # Write the header row
-        writer.writerow(headers)
-
-        # Write the data rows
-        for line in data_lines:
-            # Split the line into columns based on tab delimiter
-            columns = line.strip().split("\t")
-            # Replace '\N' with an empty string to handle null values
-            columns = [col if col != "\\N" else "" for col in columns]
-            writer.writerow(columns)
-
-    logging.info(f"Data successfully written to {output_csv_file}")
 
 
 def init_duckdb_schema(input_sql_dir, output_dir, duckdb_file=None):
@@ -227,22 +421,22 @@ def init_duckdb_schema(input_sql_dir, output_dir, duckdb_file=None):
 
     This function creates a DuckDB database schema based on SQL files located in a specified directory.
     It processes each SQL file, converting PostgreSQL-specific syntax to DuckDB-compatible commands where necessary.
-    The function also handles special cases for views and tables that require data preloading from CSV files,
-    which are generated from specified SQL files.
+    The function also handles special cases for views and tables that require data preloading from the
+    COPY data in specified SQL files.
 
     Args:
         input_sql_dir (str or Path): The directory containing SQL files for schema creation and data preloading.
-        output_dir (str or Path): The directory where the DuckDB database file and any intermediate CSV files will be stored.
+        output_dir (str or Path): The directory where the DuckDB database file and the converted SQL files will be stored.
 
     The process involves:
     - Deleting any existing DuckDB database file in the output directory.
     - Creating a new DuckDB database file and connecting to it.
     - Creating a specified schema within the DuckDB database.
     - Processing each SQL file to convert PostgreSQL syntax to DuckDB-compatible syntax.
-    - Handling special cases for views and tables that require data preloading, including converting specific SQL files to CSV format and importing them into DuckDB.
+    - Handling special cases for views and tables that require data preloading, including inserting the COPY data of specific SQL files directly into DuckDB.
     - Writing modified SQL commands to new SQL files in the output directory for record-keeping.
 
-    Special handling is provided for views and tables that require data preloading, with specific SQL commands replaced or augmented by commands to load data from CSV files. This includes creating views for sequence GC content and preloading taxonomic and monomer data from CSV files.
+    Special handling is provided for views and tables that require data preloading, with specific SQL commands replaced or augmented by commands to load the preloaded data. This includes creating views for sequence GC content and preloading taxonomic and monomer data from their PostgreSQL COPY dumps.
     """
     logging.debug(
         f"Initializing DuckDB schema from SQL files in {input_sql_dir} --> {duckdb_file}"
@@ -273,123 +467,38 @@ def init_duckdb_schema(input_sql_dir, output_dir, duckdb_file=None):
         f"CREATE SCHEMA IF NOT EXISTS {schema_name};\nSET SCHEMA '{schema_name}';\n"
     )
 
-    # List of tables and views to process
-    TABLES = [
-        "sampling_sites",
-        "bgc_types",
-        "substrates",
-        "taxa",
-        "profiles",
-        "as_domain_profiles",
-        "pfams",
-        "gene_ontologies",
-        "resfams",
-        "tigrfams",
-        "bgc_rules",
-        "samples",
-        "isolates",
-        "genomes",
-        "dna_sequences",
-        "regions",
-        "candidates",
-        "protoclusters",
-        "functional_classes",
-        "smcogs",
-        "cdss",
-        "genes",
-        "ripps",
-        "t2pks",
-        "monomers",
-        "modules",
-        "as_domains",
-        "clusterblast_algorithms",
-        "clusterblast_hits",
-        "tta_codons",
-        "pfam_domains",
-        "pfam_go_entries",
-        "filenames",
-        "resfam_domains",
-        "tfbs",
-        "comparippson",
-        "tigrfam_domains",
-        "cluster_compare_hits",
-        "rel_candidates_protoclusters",
-        "rel_candidates_types",
-        "rel_candidates_modules",
-        "rel_cds_candidates",
-        "rel_cds_protoclusters",
-        "rel_regions_types",
-        "rel_as_domains_substrates",
-        "smcog_hits",
-        "profile_hits",
-        "rel_modules_monomers",
-        "view_sequence_gc_content",
-        "view_sequence_lengths",
-        "preload_taxa",
-        "preload_monomers",
-    ]
+    # Batch all catalog updates and data loads in a single transaction
+    conn.execute("BEGIN TRANSACTION;")
 
-    view_sequence_gc_content = """
-    CREATE VIEW antismash.sequence_gc_content AS
-    SELECT
-        accession,
-        ROUND(100.0 * (
-            length(dna) - length(replace(dna, 'G', '')) +
-            length(dna) - length(replace(dna, 'C', ''))
-        ) / length(dna), 2) AS gc_content
-    FROM
-        antismash.dna_sequences;
-    """
-
-    # Convert sql inputs to csv for monomers
-    monomer_csv = outdir / "preload_monomers.csv"
-    sql_to_csv(
-        input_sql_dir / "preload_monomers.sql",
-        monomer_csv,
-        headers=["monomer_id", "substrate_id", "name", "description"],
-    )
+    # Read the preloaded monomers
+    monomer_columns = ["monomer_id", "substrate_id", "name", "description"]
+    monomer_sql_file = input_sql_dir / "preload_monomers.sql"
 
-    # start seq index at the length of the feeded csv
-    last_monomer_id = 1
-    with open(monomer_csv, "r") as file:
-        for row in csv.reader(file):
-            if row:  # Check if the row is not empty
-                last_monomer_id = row[0]  # Assuming monomer_id is in the first column
-    # The next ID to start from would be the last ID in the CSV +
-    next_id_start = int(last_monomer_id) + 1
+    # start seq index after the last preloaded monomer_id
+    next_id_start = _next_copy_id(monomer_sql_file)
     logging.info(f"Starting monomer_id sequence at {next_id_start}")
     monomers = f"""
     CREATE SEQUENCE antismash.antismash_monomers_monomer_id_seq START {next_id_start};
     CREATE TABLE antismash.monomers ( monomer_id INTEGER DEFAULT nextval('antismash.antismash_monomers_monomer_id_seq') NOT NULL PRIMARY KEY, substrate_id int4 NOT NULL REFERENCES antismash.substrates, name text NOT NULL, description text, CONSTRAINT monomer_name_unique UNIQUE (name) );
     """
 
-    # Convert sql inputs to csv for taxa
-    taxa_csv = outdir / "preload_taxa.csv"
-    sql_to_csv(
-        input_sql_dir / "preload_taxa.sql",
-        taxa_csv,
-        headers=[
-            "tax_id",
-            "ncbi_taxid",
-            "superkingdom",
-            "kingdom",
-            "phylum",
-            "class",
-            "taxonomic_order",
-            "family",
-            "genus",
-            "species",
-            "strain",
-            "name",
-        ],
-    )
-    last_taxa_id = 1
-    with open(taxa_csv, "r") as file:
-        for row in csv.reader(file):
-            if row:  # Check if the row is not empty
-                last_taxa_id = row[0]  # Assuming monomer_id is in the first column
-    # The next ID to start from would be the last ID in the CSV +
-    next_id_start = int(last_taxa_id) + 1
+    # Read the preloaded taxa
+    taxa_columns = [
+        "tax_id",
+        "ncbi_taxid",
+        "superkingdom",
+        "kingdom",
+        "phylum",
+        "class",
+        "taxonomic_order",
+        "family",
+        "genus",
+        "species",
+        "strain",
+        "name",
+    ]
+    taxa_sql_file = input_sql_dir / "preload_taxa.sql"
+    next_id_start = _next_copy_id(taxa_sql_file)
     logging.info(f"Starting taxa_id sequence at {next_id_start}")
     taxa = f"""
     CREATE SEQUENCE antismash.antismash_taxa_tax_id_seq START {next_id_start};
@@ -397,74 +506,89 @@ def init_duckdb_schema(input_sql_dir, output_dir, duckdb_file=None):
 
     # Define exceptions for specific tables or views
     duckdb_exceptions = {
-        "view_sequence_gc_content": view_sequence_gc_content,
-        "preload_taxa": f"COPY antismash.taxa FROM '{taxa_csv}' (AUTO_DETECT TRUE);",
-        "preload_monomers": f"COPY antismash.monomers FROM '{monomer_csv}' (AUTO_DETECT TRUE);",
+        "view_sequence_gc_content": _VIEW_SEQUENCE_GC_CONTENT,
         "monomers": monomers,
         "taxa": taxa,
     }
 
-    # Process each table/view
-    for t in TABLES:
-        sql_file_path = input_sql_dir / f"{t}.sql"
-        if sql_file_path.is_file():
-            if t in list(duckdb_exceptions.keys()):
-                logging.info(f"Using customized sql for: {t}")
-                sql_command = duckdb_exceptions[t]
-            else:
-                logging.info(f"Creating table: {t}")
-                with sql_file_path.open("r") as sql_file:
-                    sql_command = sql_file.read()
-
-            sql_command = sqlparse.format(
-                sql_command, reindent=False, keyword_case="upper"
-            )
-            sanitized_sql = convert_postgres_to_duckdb(sql_command)
-            # Split the sanitized SQL into individual statements
-            statements = [
-                str(statement).strip()
-                for statement in sqlparse.parse(sanitized_sql)
-                if str(statement).strip()
-            ]
-            statements = [statement for statement in statements if statement != ";"]
-
-            outdir = Path(output_dir)
-            outdir.mkdir(parents=True, exist_ok=True)
-
-            with open(outdir / f"{t}.sql", "w") as f:
-                statement_tidy = sqlparse.format(
-                    "\n".join(statements), reindent=False, keyword_case="upper"
+    # Define the data preloaded into specific tables
+    preloads = {
+        "preload_taxa": ("antismash.taxa", taxa_columns, taxa_sql_file),
+        "preload_monomers": ("antismash.monomers", monomer_columns, monomer_sql_file),
+    }
+
+    # Record files are written in the background, overlapping with DuckDB
+    record_writes = []
+    try:
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            # Process each table/view
+            for t in TABLES:
+                if t in preloads:
+                    logging.info(f"Preloading data for: {t}")
+                    table, columns, sql_file = preloads[t]
+                    rows = _load_copy_data(conn, table, columns, sql_file)
+
+                    # Record where the data came from; the rows are not repeated
+                    record = (
+                        f"-- Loaded {rows} rows from {sql_file.name} into "
+                        f"{table} ({', '.join(columns)})\n"
+                    )
+                    record_writes.append(
+                        io_pool.submit((outdir / f"{t}.sql").write_text, record)
+                    )
+                    continue
+                if t in duckdb_exceptions:
+                    # The customized SQL is already written for DuckDB, so it is
+                    # recorded and executed as is
+                    logging.info(f"Using customized sql for: {t}")
+                    sql_script = duckdb_exceptions[t]
+                    records = [textwrap.dedent(sql_script).strip()]
+                else:
+                    # Only the files that are converted are read, so only they must
+                    # exist
+                    sql_file_path = input_sql_dir / f"{t}.sql"
+                    if not sql_file_path.is_file():
+                        logging.error(f"No such file: {sql_file_path}")
+                        exit(1)
+                    logging.info(f"Creating table: {t}")
+                    sql_command = sql_file_path.read_text(encoding="utf-8")
+
+                    # Convert into individual statements, recording them with their
+                    # keywords upper-cased
+                    statements = convert_postgres_to_duckdb(sql_command)
+                    records = map(_format_sql, statements)
+                    sql_script = "\n".join(statements)
+                record_writes.append(
+                    io_pool.submit(_write_sql_file, outdir / f"{t}.sql", records)
                 )
-                f.write(statement_tidy)
 
-            for num, statement in enumerate(statements):
-                # Ensure the statement is not just whitespace
-                if statement.strip():
-                    logging.debug(f"Executing DuckDB SQL statement {t}:{num}")
+                # Execute all statements of the file in a single call
+                if sql_script:
+                    logging.debug(f"Executing DuckDB SQL statements for {t}")
                     try:
-                        conn.execute(statement)
+                        conn.execute(sql_script)
                     except Exception as e:
                         logging.error(
-                            f"Failed to execute DuckDB SQL statement:\n{statement}\nError: {e}"
+                            f"Failed to execute DuckDB SQL statements:\n{sql_script}\nError: {e}"
                         )
-                        try:
-                            for n, s in enumerate(statement.split(";")):
-                                logging.debug(
-                                    f"Executing SQL statement {num}.{n}:\n{s}\n"
-                                )
-                                conn.execute(s)
-                        except Exception as e:
-                            logging.error(
-                                f"Failed to execute DuckDB SQL statement:\n{statement}\nError: {e}"
-                            )
-                            exit(1)
-
-        else:
-            logging.error(f"No such file: {sql_file_path}")
-            exit(1)
-
-    # Close the connection
-    conn.close()
+                        raise
+
+        # Surface any error of the record writes
+        for record_write in record_writes:
+            record_write.result()
+
+        # Commit the whole initialization at once
+        conn.execute("COMMIT;")
+    except BaseException:
+        # Discard the partial initialization on any failure or interruption,
+        # without letting a failed rollback hide the original error
+        try:
+            conn.execute("ROLLBACK;")
+        except Exception as e:
+            logging.error(f"Failed to roll back the initialization: {e}")
+        raise
+    finally:
+        conn.close()
 
 
 def main():